@@ -101,6 +101,7 @@ pub async fn run_watcher(
     state_manager: Arc<StateManager>,
 ) {
     let base_url = log.normalized_url();
+    let sth_url = format!("{}/ct/v1/get-sth", base_url);
     let source = Arc::new(Source {
         name: Arc::from(log.description.as_str()),
         url: Arc::from(base_url.as_str()),
@@ -121,7 +122,7 @@ pub async fn run_watcher(
         );
         saved_index
     } else {
-        match get_tree_size_with_retry(&client, &base_url, &config, &health).await {
+        match get_tree_size_with_retry(&client, &sth_url, &config, &health).await {
             Ok(size) => {
                 let start = size.saturating_sub(1000);
                 info!(
@@ -148,7 +149,7 @@ pub async fn run_watcher(
             );
             sleep(Duration::from_secs(config.health_check_interval_secs)).await;
 
-            match get_tree_size_with_retry(&client, &base_url, &config, &health).await {
+            match get_tree_size_with_retry(&client, &sth_url, &config, &health).await {
                 Ok(_) => {
                     info!(log = %log.description, "health check passed, resuming");
                 }
@@ -164,7 +165,7 @@ pub async fn run_watcher(
             }
         }
 
-        match get_tree_size_with_retry(&client, &base_url, &config, &health).await {
+        match get_tree_size_with_retry(&client, &sth_url, &config, &health).await {
             Ok(tree_size) => {
                 if current_index >= tree_size {
                     sleep(poll_interval).await;
@@ -176,6 +177,7 @@ pub async fn run_watcher(
                 match fetch_entries_with_retry(&client, &base_url, current_index, end, &config, &health).await {
                     Ok(entries) => {
                         let count = entries.len();
+                        let seen = chrono::Utc::now().timestamp_millis() as f64 / 1000.0;
                         for (i, entry) in entries.into_iter().enumerate() {
                             if let Some(parsed) =
                                 parse_leaf_input(&entry.leaf_input, &entry.extra_data)
@@ -187,8 +189,7 @@ pub async fn run_watcher(
                                         leaf_cert: parsed.leaf_cert,
                                         chain: Some(parsed.chain),
                                         cert_index: current_index + i as u64,
-                                        seen: chrono::Utc::now().timestamp_millis() as f64
-                                            / 1000.0,
+                                        seen,
                                         source: Arc::clone(&source),
                                     },
                                 };
@@ -222,11 +223,10 @@ pub async fn run_watcher(
 
 async fn get_tree_size_with_retry(
     client: &Client,
-    base_url: &str,
+    url: &str,
     config: &CtLogConfig,
     health: &LogHealth,
 ) -> Result<u64, String> {
-    let url = format!("{}/ct/v1/get-sth", base_url);
     let timeout = Duration::from_secs(config.request_timeout_secs);
 
     let backoff = ExponentialBuilder::default()
@@ -236,7 +236,7 @@ async fn get_tree_size_with_retry(
 
     let result = (|| async {
         let response: SthResponse = client
-            .get(&url)
+            .get(url)
             .timeout(timeout)
             .send()
             .await
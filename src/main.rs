@@ -8,7 +8,7 @@ mod state;
 mod tcp;
 mod websocket;
 
-use axum::{middleware as axum_middleware, routing::get, Json, Router};
+use axum::{middleware as axum_middleware, routing::get, serve::ListenerExt, Json, Router};
 use metrics_exporter_prometheus::PrometheusBuilder;
 use reqwest::Client;
 use smallvec::smallvec;
@@ -289,7 +289,12 @@ async fn main() {
             .await
             .expect("server error");
     } else {
-        let listener = tokio::net::TcpListener::bind(addr).await.expect("failed to bind");
+        let listener = tokio::net::TcpListener::bind(addr)
+            .await
+            .expect("failed to bind")
+            .tap_io(|tcp| {
+                let _ = tcp.set_nodelay(true);
+            });
         axum::serve(
             listener,
             app.into_make_service_with_connect_info::<SocketAddr>(),
@@ -38,7 +38,7 @@ pub async fn handle_sse_stream(
     }
 
     let rx = state.tx.subscribe();
-    let stream_type = params.stream.as_deref().unwrap_or("lite").to_string();
+    let stream_type = StreamType::from_param(params.stream.as_deref());
 
     SSE_CONNECTION_COUNT.fetch_add(1, Ordering::Relaxed);
     update_sse_metrics();
@@ -51,9 +51,8 @@ pub async fn handle_sse_stream(
     );
 
     let stream = BroadcastStream::new(rx).filter_map(move |result| {
-        let stream_type = stream_type.clone();
         std::future::ready(match result {
-            Ok(msg) => process_message(msg, &stream_type),
+            Ok(msg) => process_message(msg, stream_type),
             Err(_) => None,
         })
     });
@@ -71,14 +70,39 @@ pub async fn handle_sse_stream(
     ).into_response()
 }
 
+#[derive(Clone, Copy)]
+enum StreamType {
+    Full,
+    Lite,
+    DomainsOnly,
+}
+
+impl StreamType {
+    fn from_param(stream: Option<&str>) -> Self {
+        match stream {
+            Some("full") => StreamType::Full,
+            Some("domains") | Some("domains-only") => StreamType::DomainsOnly,
+            _ => StreamType::Lite,
+        }
+    }
+
+    fn as_str(self) -> &'static str {
+        match self {
+            StreamType::Full => "full",
+            StreamType::Lite => "lite",
+            StreamType::DomainsOnly => "domains",
+        }
+    }
+}
+
 fn process_message(
     msg: Arc<PreSerializedMessage>,
-    stream_type: &str,
+    stream_type: StreamType,
 ) -> Option<Result<Event, std::convert::Infallible>> {
     let bytes = match stream_type {
-        "full" => &msg.full,
-        "domains" | "domains-only" => &msg.domains_only,
-        _ => &msg.lite,
+        StreamType::Full => &msg.full,
+        StreamType::Lite => &msg.lite,
+        StreamType::DomainsOnly => &msg.domains_only,
     };
 
     std::str::from_utf8(bytes)
@@ -2,9 +2,9 @@ use dashmap::DashMap;
 use serde::{Deserialize, Serialize};
 use std::fs;
 use std::path::Path;
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::Arc;
 use std::time::Duration;
-use tokio::sync::RwLock;
 use tracing::{debug, error, info, warn};
 
 #[derive(Debug, Clone, Serialize, Deserialize, Default)]
@@ -23,7 +23,7 @@ struct StateFile {
 pub struct StateManager {
     file_path: Option<String>,
     states: DashMap<String, LogState>,
-    dirty: Arc<RwLock<bool>>,
+    dirty: AtomicBool,
 }
 
 impl StateManager {
@@ -31,7 +31,7 @@ impl StateManager {
         let manager = Arc::new(Self {
             file_path: file_path.clone(),
             states: DashMap::new(),
-            dirty: Arc::new(RwLock::new(false)),
+            dirty: AtomicBool::new(false),
         });
 
         if let Some(ref path) = file_path {
@@ -83,18 +83,11 @@ impl StateManager {
                 last_success: now,
             },
         );
-        if let Ok(mut dirty) = self.dirty.try_write() {
-            *dirty = true;
-        }
+        self.dirty.store(true, Ordering::Release);
     }
 
     pub async fn save_if_dirty(&self) {
-        let is_dirty = {
-            let dirty = self.dirty.read().await;
-            *dirty
-        };
-
-        if !is_dirty {
+        if !self.dirty.swap(false, Ordering::AcqRel) {
             return;
         }
 
@@ -117,22 +110,23 @@ impl StateManager {
                 match fs::write(&tmp_path, &content) {
                     Ok(_) => match fs::rename(&tmp_path, path) {
                         Ok(_) => {
-                            let mut dirty = self.dirty.write().await;
-                            *dirty = false;
                             debug!(path = %path, "saved state to file");
                         }
                         Err(e) => {
                             error!(path = %path, error = %e, "failed to rename state file");
                             let _ = fs::remove_file(&tmp_path);
+                            self.dirty.store(true, Ordering::Release);
                         }
                     },
                     Err(e) => {
                         error!(tmp_path = %tmp_path, error = %e, "failed to write temp state file");
+                        self.dirty.store(true, Ordering::Release);
                     }
                 }
             }
             Err(e) => {
                 error!(error = %e, "failed to serialize state");
+                self.dirty.store(true, Ordering::Release);
             }
         }
     }
@@ -1,3 +1,4 @@
+use bytes::Buf;
 use std::net::SocketAddr;
 use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
@@ -37,6 +38,10 @@ pub async fn run_tcp_server(
                     continue;
                 }
 
+                if let Err(e) = socket.set_nodelay(true) {
+                    warn!(peer = %peer_addr, error = %e, "failed to set TCP_NODELAY");
+                }
+
                 let rx = tx.subscribe();
                 let limiter_clone = limiter.clone();
                 tokio::spawn(async move {
@@ -89,10 +94,8 @@ async fn handle_tcp_client(
                     StreamType::DomainsOnly => &msg.domains_only,
                 };
 
-                if socket.write_all(bytes).await.is_err() {
-                    break;
-                }
-                if socket.write_all(NEWLINE).await.is_err() {
+                let mut line = bytes.clone().chain(NEWLINE);
+                if socket.write_all_buf(&mut line).await.is_err() {
                     break;
                 }
             }
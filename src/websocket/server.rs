@@ -6,6 +6,7 @@ use axum::{
     http::StatusCode,
     response::IntoResponse,
 };
+use bytes::Bytes;
 use std::net::{IpAddr, SocketAddr};
 use futures_util::{SinkExt, StreamExt};
 use std::sync::atomic::{AtomicU64, Ordering};
@@ -19,6 +20,7 @@ use crate::middleware::ConnectionLimiter;
 use crate::models::PreSerializedMessage;
 
 static HEARTBEAT_JSON: &str = r#"{"message_type":"heartbeat"}"#;
+const MAX_SEND_BATCH: usize = 64;
 
 pub struct AppState {
     pub tx: broadcast::Sender<Arc<PreSerializedMessage>>,
@@ -125,6 +127,17 @@ enum StreamType {
     DomainsOnly,
 }
 
+impl StreamType {
+    #[inline]
+    fn payload(self, msg: &PreSerializedMessage) -> Bytes {
+        match self {
+            StreamType::Full => msg.full.clone(),
+            StreamType::Lite => msg.lite.clone(),
+            StreamType::DomainsOnly => msg.domains_only.clone(),
+        }
+    }
+}
+
 async fn handle_socket(
     socket: WebSocket,
     mut rx: broadcast::Receiver<Arc<PreSerializedMessage>>,
@@ -157,13 +170,29 @@ async fn handle_socket(
             result = rx.recv() => {
                 match result {
                     Ok(msg) => {
-                        let bytes = match stream_type {
-                            StreamType::Full => msg.full.clone(),
-                            StreamType::Lite => msg.lite.clone(),
-                            StreamType::DomainsOnly => msg.domains_only.clone(),
-                        };
+                        if sender.feed(Message::Binary(stream_type.payload(&msg))).await.is_err() {
+                            break;
+                        }
+
+                        // Queue whatever is already buffered so it goes out with a single flush.
+                        let mut failed = false;
+                        for _ in 1..MAX_SEND_BATCH {
+                            match rx.try_recv() {
+                                Ok(msg) => {
+                                    if sender.feed(Message::Binary(stream_type.payload(&msg))).await.is_err() {
+                                        failed = true;
+                                        break;
+                                    }
+                                }
+                                Err(broadcast::error::TryRecvError::Lagged(n)) => {
+                                    debug!(lagged = n, "client lagged, skipping messages");
+                                    metrics::counter!("certstream_ws_messages_lagged").increment(n);
+                                }
+                                Err(_) => break,
+                            }
+                        }
 
-                        if sender.send(Message::Binary(bytes)).await.is_err() {
+                        if failed || sender.flush().await.is_err() {
                             break;
                         }
                     }